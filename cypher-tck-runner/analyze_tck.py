@@ -9,164 +9,207 @@ Usage:
     python analyze_tck.py                  # run behave and analyze
     python analyze_tck.py results.txt      # analyze a saved output file
     python analyze_tck.py --save results.txt  # run behave, save raw output, then analyze
+    python analyze_tck.py --jobs 4         # shard features across 4 behave processes
 """
 
+import functools
+import io
+import itertools
 import sys
 import re
 import subprocess
 import os
-from collections import defaultdict, Counter
+import textwrap
+from collections import defaultdict, deque, Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 
 # ── Colour helpers (disable if piped) ──────────────────────────────────────
 USE_COLOUR = sys.stdout.isatty()
 
-def _c(code, text):
-    return f"\033[{code}m{text}\033[0m" if USE_COLOUR else text
+# Precomputed prefixes: the helpers below run thousands of times per report,
+# so the colour decision is made once here instead of per call.
+if USE_COLOUR:
+    GREEN, RED, YELLOW, CYAN, BOLD, DIM = (
+        "\033[32m", "\033[31m", "\033[33m", "\033[36m", "\033[1m", "\033[2m",
+    )
+    RESET = "\033[0m"
+else:
+    GREEN = RED = YELLOW = CYAN = BOLD = DIM = RESET = ""
 
-def green(t):  return _c("32", t)
-def red(t):    return _c("31", t)
-def yellow(t): return _c("33", t)
-def cyan(t):   return _c("36", t)
-def bold(t):   return _c("1", t)
-def dim(t):    return _c("2", t)
+def green(t):  return GREEN + t + RESET
+def red(t):    return RED + t + RESET
+def yellow(t): return YELLOW + t + RESET
+def cyan(t):   return CYAN + t + RESET
+def bold(t):   return BOLD + t + RESET
+def dim(t):    return DIM + t + RESET
 
 
 # ── Error classification ──────────────────────────────────────────────────
+# Secondary detail extractors for categories whose detail sits elsewhere in
+# the line than the signature itself.
+_RE_WRONG_PROPERTY = re.compile(r'expected (\w+) but actual type is (\w+)')
+_RE_RUNTIME_ERROR = re.compile(r'RuntimeError\("(.+?)"\)')
+
+# All signatures and their detail captures combined into one named-group
+# alternation, compiled once: a single search both locates the category and
+# extracts its detail in the same pass. Branch order resolves ties at the
+# same position; otherwise the first signature appearing in the line wins.
+_CLASSIFY_RE = re.compile(
+    r'Parse error: UnexpectedToken\((?P<parse_tok>\w+)'
+    r'|Parse error: (?P<parse_other>.+)'
+    r'|Binding error: VariableNotFound\("(?P<bind_var>\w+)"\)'
+    r'|Binding error: UnsupportedExpression\("(?P<bind_expr>.+?)"\)'
+    r'|Binding error: (?P<bind_other>.+)'
+    r'|UnsupportedPattern\("(?P<pattern_detail>.+?)"\)'
+    r'|(?P<pattern_bare>UnsupportedPattern)'
+    r'|(?P<no_plan>NoValidPlan)'
+    r'|column types must match schema types, expected (?P<ct_expected>\w+) but found (?P<ct_found>\w+)'
+    r"|Sort column '(?P<sort_col>.+?)' not found"
+    r'|duration\.in(?P<duration>Seconds|Months|Days)\(\)'
+    r'|(?P<delete_unsup>DELETE not supported)'
+    r'|(?P<stmt_unsup>statement type is not supported)'
+    r'|(?P<insert_eval>Could not evaluate expression in INSERT)'
+    r'|(?P<wrong_prop>Wrong type for property)'
+    r'|Expected (?P<missing_type>SyntaxError|TypeError|SemanticError|ArgumentError) \((?P<missing_code>\w+)\), but query succeeded'
+    r'|Expected (?P<expected_type>SyntaxError|TypeError|SemanticError|ArgumentError)'
+    r'|(?P<result_mismatch>Result mismatch)'
+    r'|(?P<side_mismatch>Side effects mismatch)'
+    r'|(?P<runtime>Runtime)'
+)
+
+
+def _detail_wrong_property(m, line):
+    dm = _RE_WRONG_PROPERTY.search(line)
+    detail = f"{dm.group(1)} vs {dm.group(2)}" if dm else ""
+    return ("Runtime: WrongPropertyType", detail)
+
+
+def _detail_runtime(m, line):
+    dm = _RE_RUNTIME_ERROR.search(line)
+    detail = dm.group(1)[:80] if dm else line[:80]
+    return ("Runtime: Other", detail)
+
+
+# m.lastgroup of a _CLASSIFY_RE match -> (category, detail) builder.
+_CLASSIFY_HANDLERS = {
+    "parse_tok": lambda m, line: ("Parse: UnexpectedToken", m.group("parse_tok")),
+    "parse_other": lambda m, line: ("Parse: Other", m.group("parse_other")[:80]),
+    "bind_var": lambda m, line: ("Binder: VariableNotFound", m.group("bind_var")),
+    "bind_expr": lambda m, line: ("Binder: UnsupportedExpression", m.group("bind_expr")),
+    "bind_other": lambda m, line: ("Binder: Other", m.group("bind_other")[:80]),
+    "pattern_detail": lambda m, line: ("Planner: UnsupportedPattern", m.group("pattern_detail")[:80]),
+    "pattern_bare": lambda m, line: ("Planner: UnsupportedPattern", "unknown"),
+    "no_plan": lambda m, line: ("Optimizer: NoValidPlan", ""),
+    "ct_found": lambda m, line: ("Runtime: ColumnTypeMismatch", f"{m.group('ct_expected')} vs {m.group('ct_found')}"),
+    "sort_col": lambda m, line: ("Runtime: SortColumnNotFound", m.group("sort_col")),
+    "duration": lambda m, line: (f"Runtime: duration.in{m.group('duration')}", ""),
+    "delete_unsup": lambda m, line: ("Runtime: DeleteNotSupported", ""),
+    "stmt_unsup": lambda m, line: ("Runtime: StatementNotSupported", ""),
+    "insert_eval": lambda m, line: ("Runtime: InsertExpressionEval", ""),
+    "wrong_prop": _detail_wrong_property,
+    "missing_code": lambda m, line: (f"Missing Error: {m.group('missing_type')}", m.group("missing_code")),
+    "expected_type": lambda m, line: (f"Expected Error: {m.group('expected_type')}", line[:80]),
+    "result_mismatch": lambda m, line: ("Result: Mismatch", ""),
+    "side_mismatch": lambda m, line: ("Result: SideEffectsMismatch", ""),
+    "runtime": _detail_runtime,
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def classify_error(error_line):
-    """Classify a single error line into (category, detail)."""
-    line = error_line.strip()
-
-    # --- Parse errors ---
-    m = re.search(r'Parse error: UnexpectedToken\((\w+)', line)
-    if m:
-        return ("Parse: UnexpectedToken", m.group(1))
-
-    if "Parse error:" in line:
-        m2 = re.search(r'Parse error: (.+)', line)
-        detail = m2.group(1) if m2 else "unknown"
-        return ("Parse: Other", detail[:80])
-
-    # --- Binding errors ---
-    m = re.search(r'Binding error: VariableNotFound\("(\w+)"\)', line)
-    if m:
-        return ("Binder: VariableNotFound", m.group(1))
-
-    m = re.search(r'Binding error: UnsupportedExpression\("(.+?)"\)', line)
-    if m:
-        return ("Binder: UnsupportedExpression", m.group(1))
-
-    if "Binding error:" in line:
-        m2 = re.search(r'Binding error: (.+)', line)
-        detail = m2.group(1) if m2 else "unknown"
-        return ("Binder: Other", detail[:80])
-
-    # --- Planner / optimizer ---
-    if "UnsupportedPattern" in line:
-        m = re.search(r'UnsupportedPattern\("(.+?)"\)', line)
-        detail = m.group(1) if m else "unknown"
-        return ("Planner: UnsupportedPattern", detail[:80])
-
-    if "NoValidPlan" in line:
-        return ("Optimizer: NoValidPlan", "")
-
-    # --- Runtime / execution errors ---
-    m = re.search(r'column types must match schema types, expected (\w+) but found (\w+)', line)
-    if m:
-        return ("Runtime: ColumnTypeMismatch", f"{m.group(1)} vs {m.group(2)}")
+    """Classify a single error line into (category, detail).
 
-    m = re.search(r"Sort column '(.+?)' not found", line)
-    if m:
-        return ("Runtime: SortColumnNotFound", m.group(1))
-
-    if "duration.inSeconds()" in line:
-        return ("Runtime: duration.inSeconds", "")
-    if "duration.inMonths()" in line:
-        return ("Runtime: duration.inMonths", "")
-    if "duration.inDays()" in line:
-        return ("Runtime: duration.inDays", "")
-
-    if "DELETE not supported" in line:
-        return ("Runtime: DeleteNotSupported", "")
-
-    if "statement type is not supported" in line:
-        return ("Runtime: StatementNotSupported", "")
-
-    if "Could not evaluate expression in INSERT" in line:
-        return ("Runtime: InsertExpressionEval", "")
-
-    if "Wrong type for property" in line:
-        m = re.search(r'expected (\w+) but actual type is (\w+)', line)
-        detail = f"{m.group(1)} vs {m.group(2)}" if m else ""
-        return ("Runtime: WrongPropertyType", detail)
-
-    if "RuntimeError" in line or "Runtime" in line:
-        # Generic runtime
-        m = re.search(r'RuntimeError\("(.+?)"\)', line)
-        detail = m.group(1)[:80] if m else line[:80]
-        return ("Runtime: Other", detail)
-
-    # --- Expected errors that didn't fire ---
-    m = re.search(r'Expected (SyntaxError|TypeError|SemanticError|ArgumentError) \((\w+)\), but query succeeded', line)
-    if m:
-        return (f"Missing Error: {m.group(1)}", m.group(2))
-
-    m = re.search(r'Expected (SyntaxError|TypeError|SemanticError|ArgumentError)', line)
+    A single search of the combined pattern finds the category and its
+    detail capture in one pass; dispatch is by the matched group name.
+    Results are memoized: TCK runs repeat the same handful of error
+    signatures across hundreds of scenarios.
+    """
+    line = error_line.strip()
+    m = _CLASSIFY_RE.search(line)
     if m:
-        return (f"Expected Error: {m.group(1)}", line[:80])
-
-    # --- Result mismatch ---
-    if "Result mismatch" in line:
-        return ("Result: Mismatch", "")
-
-    # --- Side effect mismatch ---
-    if "Side effects mismatch" in line:
-        return ("Result: SideEffectsMismatch", "")
-
-    # --- Fallback ---
+        return _CLASSIFY_HANDLERS[m.lastgroup](m, line)
     return ("Other", line[:100])
 
 
 # ── Parse behave output ───────────────────────────────────────────────────
-def parse_behave_output(text):
+@dataclass(slots=True)
+class Scenario:
+    """One parsed scenario outcome. Slotted: a TCK run produces tens of
+    thousands of these, and fixed-offset attribute storage is far more
+    compact than a dict per scenario."""
+
+    feature: str
+    name: str
+    file_loc: str
+    status: str = "passed"
+    errors: list = field(default_factory=list)
+    query: str = ""
+
+
+_FEATURE_RE = re.compile(r'^Feature:\s+(.+?)(?:\s+#\s+(.+))?$')
+_SCENARIO_RE = re.compile(r'^\s+Scenario(?:\s+Outline)?:\s+(.+?)(?:\s+#\s+(.+))?$')
+_TRACEBACK_ERR_PREFIXES = (
+    "AttributeError", "TypeError", "KeyError", "ValueError", "IndexError",
+    "AssertionError", "NotImplementedError", "Exception", "StopIteration",
+)
+_SUMMARY_RE = re.compile(r'(\d+) scenarios? passed, (\d+) failed, (\d+) error')
+_SUMMARY_SKIPPED_RE = re.compile(r'(\d+) scenarios? .* (\d+) skipped')
+
+
+def parse_behave_output(lines):
     """
-    Parse the full behave --no-capture output.
+    Parse behave --no-capture output from an iterable of lines.
+
+    Accepts any line iterable (an open file, a subprocess stdout pipe, or
+    a list) so large runs are processed without materializing the whole
+    output in memory. Only a small tail is retained for the summary lines.
+
     Returns:
-        scenarios: list of dicts with keys:
-            feature, name, file_loc, status, errors, query
+        scenarios: list of Scenario objects
         summary: dict parsed from the summary lines
     """
     scenarios = []
     current_feature = ""
     current_scenario = None
     in_query = False
-    query_lines = []
+    query_buf = io.StringIO()
+    tail = deque(maxlen=50)  # behave prints its summary in the last few lines
 
-    for raw_line in text.splitlines():
+    # Bind the compiled matchers to locals: LOAD_FAST beats LOAD_GLOBAL in a
+    # loop that may run hundreds of thousands of times.
+    feature_match = _FEATURE_RE.match
+    scenario_match = _SCENARIO_RE.match
+
+    for raw_line in lines:
         line = raw_line.rstrip()
+        tail.append(line)
+
+        # Cheap first-character dispatch: feature headers start with 'F' in
+        # column 0, scenario headers are indented. Almost every other line
+        # skips both header regexes entirely.
+        c0 = line[:1]
 
         # Feature header
-        fm = re.match(r'^Feature:\s+(.+?)(?:\s+#\s+(.+))?$', line)
-        if fm:
-            current_feature = fm.group(1).strip()
-            continue
+        if c0 == 'F':
+            fm = feature_match(line)
+            if fm:
+                current_feature = fm.group(1).strip()
+                continue
 
         # Scenario header (matches both "Scenario:" and "Scenario Outline:")
-        sm = re.match(r'^\s+Scenario(?:\s+Outline)?:\s+(.+?)(?:\s+#\s+(.+))?$', line)
+        sm = scenario_match(line) if c0 in (' ', '\t') and 'Scenario' in line else None
         if sm:
             # Save previous scenario
             if current_scenario is not None:
                 scenarios.append(current_scenario)
-            current_scenario = {
-                "feature": current_feature,
-                "name": sm.group(1).strip(),
-                "file_loc": (sm.group(2) or "").strip(),
-                "status": "passed",
-                "errors": [],
-                "query": "",
-            }
+            current_scenario = Scenario(
+                feature=current_feature,
+                name=sm.group(1).strip(),
+                file_loc=(sm.group(2) or "").strip(),
+            )
             in_query = False
-            query_lines = []
+            query_buf = io.StringIO()
             continue
 
         if current_scenario is None:
@@ -176,52 +219,59 @@ def parse_behave_output(text):
         if '"""' in line:
             if in_query:
                 in_query = False
-                current_scenario["query"] = "\n".join(query_lines).strip()
-                query_lines = []
+                # One dedent+strip per query block instead of a stripped
+                # string allocation per line.
+                current_scenario.query = textwrap.dedent(query_buf.getvalue()).strip()
+                query_buf = io.StringIO()
             else:
                 in_query = True
             continue
 
         if in_query:
-            query_lines.append(line.strip())
+            query_buf.write(line)
+            query_buf.write("\n")
             continue
 
         # ASSERT FAILED lines
         if "ASSERT FAILED:" in line:
-            current_scenario["status"] = "failed"
+            current_scenario.status = "failed"
             err_text = line.split("ASSERT FAILED:", 1)[1].strip()
-            current_scenario["errors"].append(err_text)
+            current_scenario.errors.append(err_text)
             continue
 
         # RuntimeError lines (standalone, not inside ASSERT FAILED)
         if line.strip().startswith("RuntimeError:"):
-            current_scenario["status"] = "error"
-            current_scenario["errors"].append(line.strip())
+            current_scenario.status = "error"
+            current_scenario.errors.append(line.strip())
             continue
 
         # Traceback (mark as error)
         if line.strip().startswith("Traceback"):
-            current_scenario["status"] = "error"
+            current_scenario.status = "error"
             continue
 
-        # Capture error message lines after Traceback
-        em = re.match(r'^\s+((?:AttributeError|TypeError|KeyError|ValueError|IndexError|AssertionError|NotImplementedError|Exception|StopIteration)\S*:.+)', line)
-        if em and current_scenario["status"] == "error":
-            current_scenario["errors"].append(em.group(1).strip())
-            continue
+        # Capture error message lines after Traceback.
+        # str.startswith on a tuple of prefixes is a C-level memcmp loop,
+        # far cheaper than the old regex alternation.
+        if current_scenario.status == "error":
+            stripped = line.lstrip()
+            if stripped.startswith(_TRACEBACK_ERR_PREFIXES) and ":" in stripped:
+                current_scenario.errors.append(stripped)
+                continue
 
     # Don't forget the last scenario
     if current_scenario is not None:
         scenarios.append(current_scenario)
 
-    # Parse summary line
+    # Parse summary line from the retained tail
+    tail_text = "\n".join(tail)
     summary = {}
-    sm = re.search(r'(\d+) scenarios? passed, (\d+) failed, (\d+) error', text)
+    sm = _SUMMARY_RE.search(tail_text)
     if sm:
         summary["passed"] = int(sm.group(1))
         summary["failed"] = int(sm.group(2))
         summary["errored"] = int(sm.group(3))
-    sm2 = re.search(r'(\d+) scenarios? .* (\d+) skipped', text)
+    sm2 = _SUMMARY_SKIPPED_RE.search(tail_text)
     if sm2:
         summary["skipped"] = int(sm2.group(2))
 
@@ -236,66 +286,78 @@ def print_report(scenarios, summary):
     errored = summary.get("errored", 0)
     skipped = summary.get("skipped", 0)
 
-    print()
-    print(bold("=" * 72))
-    print(bold("  TCK Test Results"))
-    print(bold("=" * 72))
-    print()
-    print(f"  {green(f'{passed:>5} passed')}  "
+    # Build the report in memory and flush it with one write at the end:
+    # one stdout lock acquisition and one flush instead of one per line.
+    out = []
+    emit = out.append
+
+    emit("")
+    emit(bold("=" * 72))
+    emit(bold("  TCK Test Results"))
+    emit(bold("=" * 72))
+    emit("")
+    emit(f"  {green(f'{passed:>5} passed')}  "
           f"{red(f'{failed:>5} failed')}  "
           f"{yellow(f'{errored:>5} error')}  "
           f"{dim(f'{skipped:>5} skipped')}  "
           f"  {bold(f'{total} total')}")
     pct = (passed / total * 100) if total else 0
-    print(f"  Pass rate: {bold(f'{pct:.1f}%')}")
-    print()
+    emit(f"  Pass rate: {bold(f'{pct:.1f}%')}")
+    emit("")
 
     # Classify all errors
     category_counts = Counter()      # category -> count
     category_details = defaultdict(Counter)  # category -> {detail -> count}
-    category_examples = defaultdict(list)    # category -> [(scenario_name, file_loc, query)]
+    # category -> up to 3 of (scenario_name, file_loc, query); the bounded
+    # deque makes the append unconditional instead of length-guarded.
+    category_examples = defaultdict(lambda: deque(maxlen=3))
+
+    failed_scenarios = [s for s in scenarios if s.status in ("failed", "error")]
 
-    failed_scenarios = [s for s in scenarios if s["status"] in ("failed", "error")]
+    # Classify each distinct first-error string once; identical signatures
+    # repeat across hundreds of scenarios, so this batches the regex work.
+    classified = {
+        err: classify_error(err)
+        for err in {sc.errors[0] for sc in failed_scenarios if sc.errors}
+    }
 
     for sc in failed_scenarios:
-        if not sc["errors"]:
+        if not sc.errors:
             cat = "Unknown (no error captured)"
             category_counts[cat] += 1
-            category_examples[cat].append((sc["name"], sc["file_loc"], sc["query"]))
+            category_examples[cat].append((sc.name, sc.file_loc, sc.query))
             continue
 
         # Use the first error to classify the scenario (avoid double-counting)
-        first_error = sc["errors"][0]
-        cat, detail = classify_error(first_error)
+        cat, detail = classified[sc.errors[0]]
         category_counts[cat] += 1
         if detail:
             category_details[cat][detail] += 1
-        if len(category_examples[cat]) < 3:  # Keep up to 3 examples
-            category_examples[cat].append((sc["name"], sc["file_loc"], sc["query"]))
+        category_examples[cat].append((sc.name, sc.file_loc, sc.query))
 
     # Print categories sorted by count
-    print(bold("-" * 72))
-    print(bold("  Error Breakdown (by first error per scenario)"))
-    print(bold("-" * 72))
-    print()
+    emit(bold("-" * 72))
+    emit(bold("  Error Breakdown (by first error per scenario)"))
+    emit(bold("-" * 72))
+    emit("")
 
     for cat, count in category_counts.most_common():
         bar = "█" * min(count // 5, 40) or "▏"
-        print(f"  {red(f'{count:>5}')}  {cat:<45}  {dim(bar)}")
+        emit(f"  {red(f'{count:>5}')}  {cat:<45}  {dim(bar)}")
 
         # Show top details
         details = category_details.get(cat)
         if details:
             for det, dcount in details.most_common(5):
-                print(f"         {dim(f'{dcount:>4}x')}  {dim(det[:70])}")
+                emit(f"         {dim(f'{dcount:>4}x')}  {dim(det[:70])}")
 
-    print()
+    emit("")
 
     # Show top-level summary table
-    print(bold("-" * 72))
-    print(bold("  High-Level Groups"))
-    print(bold("-" * 72))
-    print()
+    emit(bold("-" * 72))
+    emit(bold("  High-Level Groups"))
+    emit(bold("-" * 72))
+    emit("")
 
     groups = defaultdict(int)
     for cat, count in category_counts.items():
@@ -305,48 +367,119 @@ def print_report(scenarios, summary):
     for grp, count in sorted(groups.items(), key=lambda x: -x[1]):
         pct_of_fail = count / max(len(failed_scenarios), 1) * 100
         bar = "█" * min(count // 10, 40) or "▏"
-        print(f"  {count:>5}  ({pct_of_fail:>5.1f}%)  {grp:<30}  {dim(bar)}")
+        emit(f"  {count:>5}  ({pct_of_fail:>5.1f}%)  {grp:<30}  {dim(bar)}")
 
-    print()
+    emit("")
 
     # Feature-level failure breakdown
     feature_fails = Counter()
     for sc in failed_scenarios:
-        feature_fails[sc["feature"]] += 1
+        feature_fails[sc.feature] += 1
 
-    print(bold("-" * 72))
-    print(bold("  Top 15 Failing Features"))
-    print(bold("-" * 72))
-    print()
+    emit(bold("-" * 72))
+    emit(bold("  Top 15 Failing Features"))
+    emit(bold("-" * 72))
+    emit("")
     for feat, count in feature_fails.most_common(15):
-        print(f"  {red(f'{count:>5}')}  {feat[:65]}")
+        emit(f"  {red(f'{count:>5}')}  {feat[:65]}")
 
-    print()
+    emit("")
 
     # Optionally show example queries for the top error categories
-    print(bold("-" * 72))
-    print(bold("  Example Queries (first 2 per top-10 category)"))
-    print(bold("-" * 72))
-    print()
+    emit(bold("-" * 72))
+    emit(bold("  Example Queries (first 2 per top-10 category)"))
+    emit(bold("-" * 72))
+    emit("")
     for cat, _ in category_counts.most_common(10):
-        examples = category_examples.get(cat, [])
+        examples = category_examples.get(cat)
         if not examples:
             continue
-        print(f"  {bold(cat)}:")
-        for name, loc, query in examples[:2]:
+        emit(f"  {bold(cat)}:")
+        for name, loc, query in itertools.islice(examples, 2):
             q_display = query.replace("\n", " ")[:80] if query else "(no query captured)"
-            print(f"    {dim(loc)}")
-            print(f"    {cyan(q_display)}")
-        print()
+            emit(f"    {dim(loc)}")
+            emit(f"    {cyan(q_display)}")
+        emit("")
+
+    emit(bold("=" * 72))
+    emit("")
 
-    print(bold("=" * 72))
-    print()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ── Main ──────────────────────────────────────────────────────────────────
+def _tee_lines(lines, sink):
+    """Yield lines unchanged while copying them to a writable sink."""
+    for line in lines:
+        sink.write(line)
+        yield line
+
+
+def _run_behave(runner_dir, targets, sink=None):
+    """Run one behave process over the given targets and parse its output."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "behave", *targets, "--no-capture"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, cwd=str(runner_dir), bufsize=1,
+    )
+    try:
+        lines = proc.stdout if sink is None else _tee_lines(proc.stdout, sink)
+        return parse_behave_output(lines)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def _run_behave_parallel(runner_dir, jobs, save_path):
+    """Shard the feature files across `jobs` behave processes.
+
+    TCK scenarios are independent (each builds its own graph), so the
+    suite is embarrassingly parallel at file granularity. Each shard runs
+    in its own interpreter with its own graph and plan cache; the parsed
+    scenarios and summary counts are merged afterwards. Round-robin
+    assignment spreads the large feature files across shards.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    feature_files = sorted(
+        str(p.relative_to(runner_dir))
+        for p in (runner_dir / "features").rglob("*.feature")
+    )
+    shards = [s for s in (feature_files[i::jobs] for i in range(jobs)) if s]
+    if len(shards) <= 1:
+        # Nothing to parallelize — run as before.
+        if save_path:
+            with open(save_path, "w") as f:
+                return _run_behave(runner_dir, ["features/"], f)
+        return _run_behave(runner_dir, ["features/"])
+
+    # Per-shard in-memory sinks keep --save output unscrambled; the raw
+    # streams are concatenated shard-by-shard at the end.
+    sinks = [io.StringIO() if save_path else None for _ in shards]
+    with ThreadPoolExecutor(max_workers=len(shards)) as ex:
+        results = list(ex.map(
+            lambda pair: _run_behave(runner_dir, pair[0], pair[1]),
+            zip(shards, sinks),
+        ))
+
+    scenarios = []
+    summary = Counter()
+    for shard_scenarios, shard_summary in results:
+        scenarios.extend(shard_scenarios)
+        summary.update(shard_summary)
+
+    if save_path:
+        with open(save_path, "w") as f:
+            for sink in sinks:
+                f.write(sink.getvalue())
+
+    return scenarios, dict(summary)
+
+
 def main():
     save_path = None
     input_file = None
+    jobs = 1
 
     args = sys.argv[1:]
     if "--save" in args:
@@ -355,28 +488,38 @@ def main():
             save_path = args[idx + 1]
         args = [a for i, a in enumerate(args) if i != idx and i != idx + 1]
 
+    if "--jobs" in args:
+        idx = args.index("--jobs")
+        if idx + 1 < len(args):
+            jobs = max(1, int(args[idx + 1]))
+        args = [a for i, a in enumerate(args) if i != idx and i != idx + 1]
+
     if args and not args[0].startswith("-"):
         input_file = args[0]
 
     if input_file:
         print(f"Reading saved output from {input_file}...")
         with open(input_file) as f:
-            raw = f.read()
+            scenarios, summary = parse_behave_output(f)
     else:
         runner_dir = Path(__file__).parent
-        print(f"Running behave in {runner_dir}...")
-        result = subprocess.run(
-            [sys.executable, "-m", "behave", "features/", "--no-capture"],
-            capture_output=True, text=True, cwd=str(runner_dir),
-        )
-        raw = result.stdout + result.stderr
-
-        if save_path:
-            with open(save_path, "w") as f:
-                f.write(raw)
-            print(f"Raw output saved to {save_path}")
+        if jobs > 1:
+            print(f"Running behave in {runner_dir} across {jobs} processes...")
+            scenarios, summary = _run_behave_parallel(runner_dir, jobs, save_path)
+            if save_path:
+                print(f"Raw output saved to {save_path}")
+        else:
+            print(f"Running behave in {runner_dir}...")
+            # Stream behave's output straight into the parser instead of
+            # buffering the whole run in memory first; parsing overlaps
+            # with behave execution.
+            if save_path:
+                with open(save_path, "w") as f:
+                    scenarios, summary = _run_behave(runner_dir, ["features/"], f)
+                print(f"Raw output saved to {save_path}")
+            else:
+                scenarios, summary = _run_behave(runner_dir, ["features/"])
 
-    scenarios, summary = parse_behave_output(raw)
     print_report(scenarios, summary)
 
 
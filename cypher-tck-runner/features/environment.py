@@ -8,6 +8,8 @@ regardless of whether RP is available.
 
 from __future__ import annotations
 
+import queue
+import threading
 from typing import TYPE_CHECKING, Any
 
 from raphtory import Graph
@@ -31,7 +33,24 @@ def _get_agent(context: "Context") -> "BehaveAgent | None":
 
 
 def _rp_call(context: "Context", fn_name: str, *args: Any) -> None:
-    """Call an RP agent method, disabling the agent on any failure."""
+    """Queue an RP agent call for the background drain thread.
+
+    Step/scenario events are delivered off the test thread so that test
+    wallclock is decoupled from ReportPortal network latency. If the
+    drain thread isn't running (RP disabled), this is a no-op.
+    """
+    agent = _get_agent(context)
+    if not agent:
+        return
+    rp_queue = getattr(context, "_rp_queue", None)
+    if rp_queue is not None:
+        rp_queue.put((fn_name, args))
+        return
+    _rp_invoke(context, fn_name, args)
+
+
+def _rp_invoke(context: "Context", fn_name: str, args: tuple) -> None:
+    """Invoke an RP agent method, disabling the agent on any failure."""
     agent = _get_agent(context)
     if not agent:
         return
@@ -42,6 +61,16 @@ def _rp_call(context: "Context", fn_name: str, *args: Any) -> None:
         context.rp_agent = None
 
 
+def _rp_drain(context: "Context", rp_queue: "queue.Queue") -> None:
+    """Drain thread body: deliver queued RP events until the sentinel."""
+    while True:
+        item = rp_queue.get()
+        if item is None:
+            break
+        fn_name, args = item
+        _rp_invoke(context, fn_name, args)
+
+
 def _load_rp_config() -> "Config | None":
     """Read [report_portal] from behave.ini next to this file and return a Config."""
     import os
@@ -60,14 +89,43 @@ def _load_rp_config() -> "Config | None":
     return Config(**rp_cfg)
 
 
+_RP_PROBE_TTL_SECONDS = 300
+
+
 def _rp_is_reachable(cfg: "Config") -> bool:
-    """Quick check whether the RP endpoint is actually listening."""
+    """Quick check whether the RP endpoint is actually listening.
+
+    The probe result is cached in a tempfile for a few minutes so that
+    back-to-back behave runs in an RP-less environment don't each pay
+    the 2-second connection timeout.
+    """
+    import hashlib
+    import tempfile
+    import time
     import urllib.request
+    from pathlib import Path
+
+    probe_cache = (
+        Path(tempfile.gettempdir())
+        / f"rp_probe_{hashlib.md5(cfg.endpoint.encode()).hexdigest()}"
+    )
+    try:
+        if time.time() - probe_cache.stat().st_mtime < _RP_PROBE_TTL_SECONDS:
+            return probe_cache.read_text() == "ok"
+    except OSError:
+        pass  # no cached probe yet
+
     try:
         urllib.request.urlopen(cfg.endpoint, timeout=2)
-        return True
+        reachable = True
     except Exception:
-        return False
+        reachable = False
+
+    try:
+        probe_cache.write_text("ok" if reachable else "bad")
+    except OSError:
+        pass  # caching is best-effort
+    return reachable
 
 
 def before_all(context: Context) -> None:
@@ -89,6 +147,11 @@ def before_all(context: Context) -> None:
                     rp_service = create_rp_service(cfg)
                     context.rp_agent = BehaveAgent(cfg, rp_service)
                     context.rp_agent.start_launch(context)
+                    context._rp_queue = queue.Queue()
+                    context._rp_thread = threading.Thread(
+                        target=_rp_drain, args=(context, context._rp_queue), daemon=True
+                    )
+                    context._rp_thread.start()
                     print("[RP] Streaming results to ReportPortal")
         except Exception as exc:
             context.rp_agent = None
@@ -102,6 +165,8 @@ def before_scenario(context: Context, scenario: Scenario) -> None:
     context.last_query = None
     context.expected_error = None
     context.actual_error = None
+    context.query_parameters = None
+    context.side_effects = None
     _rp_call(context, "start_scenario", context, scenario)
 
 
@@ -123,3 +188,7 @@ def after_step(context: Context, step: Any) -> None:
 def after_all(context: Context) -> None:
     """Finish the ReportPortal launch after all scenarios complete."""
     _rp_call(context, "finish_launch", context)
+    rp_queue = getattr(context, "_rp_queue", None)
+    if rp_queue is not None:
+        rp_queue.put(None)  # sentinel: flush remaining events and stop
+        context._rp_thread.join()
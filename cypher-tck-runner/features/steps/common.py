@@ -1,12 +1,75 @@
 
-from dataclasses import dataclass
-from typing import Any
+import re
+from typing import Any, Iterable
 
+# Clauses that can mutate the graph. Queries without any of these are
+# read-only and need no side-effect accounting.
+_WRITE_RE = re.compile(r'\b(CREATE|DELETE|SET|REMOVE|MERGE|DROP|DETACH)\b', re.IGNORECASE)
 
-@dataclass
-class ResultTable: 
-    columns: list[str] 
-    rows: list[dict[str, Any]]
+
+def query_is_readonly(query: str) -> bool:
+    """Return True if the query contains no write clauses."""
+    return _WRITE_RE.search(query) is None
+
+
+# One anchored classifier for Cypher literals in Gherkin tables. A single
+# match replaces the keyword/quote/bracket cascade and the int()/float()
+# try/except probes (each a raised-and-caught ValueError) per value.
+_LITERAL_RE = re.compile(
+    r"^(?:(?P<keyword>null|true|false)"
+    r"|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<quote>['\"])(?P<string>.*)(?P=quote)"
+    r"|(?P<bracketed>[\[{].*[\]}]))$",
+    re.DOTALL,
+)
+
+# Keyword literals: one hash lookup instead of a comparison chain.
+_LITERAL_KEYWORDS = {"null": None, "true": True, "false": False}
+
+
+def parse_cypher_literal(raw: str) -> Any:
+    """Parse a Cypher literal from a table cell into a Python value.
+
+    null/true/false and numbers become their Python equivalents, quoted
+    strings are unquoted, and anything else (lists, maps, unrecognized
+    tokens) is returned as the raw string.
+    """
+    m = _LITERAL_RE.match(raw)
+    if not m:
+        return raw
+    keyword = m.group("keyword")
+    if keyword:
+        return _LITERAL_KEYWORDS[keyword]
+    number = m.group("number")
+    if number is not None:
+        if "." in number or "e" in number or "E" in number:
+            return float(number)
+        return int(number)
+    string = m.group("string")
+    if string is not None:
+        return string
+    return raw  # bracketed lists/maps are kept as strings
+
+
+class ResultTable:
+    """Query result: column names plus rows of per-column dicts.
+
+    ``rows`` accepts any iterable and is materialized lazily on first
+    access, so scenarios that only assert on errors or columns never pay
+    for converting the result rows.
+    """
+
+    def __init__(self, columns: list[str], rows: Iterable[dict[str, Any]]) -> None:
+        self.columns = list(columns)
+        self._rows_source = rows
+        self._rows: list[dict[str, Any]] | None = None
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        if self._rows is None:
+            self._rows = list(self._rows_source)
+            self._rows_source = None  # free the source iterable
+        return self._rows
 
     def is_empty(self) -> bool:
         return len(self.rows) == 0
\ No newline at end of file
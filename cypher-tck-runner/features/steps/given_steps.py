@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from behave import given
 from cypher_tck.graph_db import SideEffects
 from raphtory import Graph
-from raphtory.gql import gql
+from raphtory.gql import gql, register_procedure
 import common
 
 if TYPE_CHECKING:
     from behave.runner import Context
 
+# Procedure signature: name(input_params) :: (output_params).
+# Compiled once — thousands of TCK scenarios register procedures.
+_PROC_SIG_RE = re.compile(r'([\w.]+)\((.*?)\)\s*::\s*\((.*?)\)', re.DOTALL)
+
 
 @given("an empty graph")
 def step_given_empty_graph(context: Context) -> None:
@@ -56,13 +61,24 @@ def step_given_having_executed(context: Context) -> None:
     if graph is None:
         raise ValueError("Graph database not initialized. Ensure you have an 'an empty graph' or 'any graph' step before this one.")
     
-    count_nodes_before = graph.count_nodes()
-    count_relationships_before = graph.count_edges()
+    # Setup queries are nearly always writes, but the occasional read-only
+    # one (e.g. warming a procedure) doesn't need the before/after counts.
+    readonly = common.query_is_readonly(query)
+    if not readonly:
+        count_nodes_before = graph.count_nodes()
+        count_relationships_before = graph.count_edges()
 
     results = gql(graph, query)
-    context.query_result = common.ResultTable(columns=results.columns, rows=list(results))
+    # ResultTable materializes lazily; setup results are rarely inspected.
+    context.query_result = common.ResultTable(columns=results.columns, rows=results)
     # Store the side effects from setup (in case they're needed)
-    context.setup_side_effects = SideEffects( nodes_created=graph.count_nodes() - count_nodes_before, relationships_created=graph.count_edges() - count_relationships_before, )
+    if readonly:
+        context.setup_side_effects = SideEffects()
+    else:
+        context.setup_side_effects = SideEffects(
+            nodes_created=graph.count_nodes() - count_nodes_before,
+            relationships_created=graph.count_edges() - count_relationships_before,
+        )
 
 
 @given("parameters are:")
@@ -95,32 +111,9 @@ def step_given_parameters(context: Context) -> None:
             raise ValueError(f"Expected 2 columns in parameter table, got {len(row_values)}")
 
         param_name = row_values[0].strip()
-        param_value_str = row_values[1].strip()
-
-        # Parse the value (similar to procedure parsing)
-        if param_value_str == 'null':
-            params[param_name] = None
-        elif param_value_str == 'true':
-            params[param_name] = True
-        elif param_value_str == 'false':
-            params[param_name] = False
-        elif (param_value_str.startswith("'") and param_value_str.endswith("'")) or \
-             (param_value_str.startswith('"') and param_value_str.endswith('"')):
-            params[param_name] = param_value_str[1:-1]
-        elif param_value_str.startswith('[') and param_value_str.endswith(']'):
-            # Simple list parsing - for now just store as string, would need full parser for complex cases
-            params[param_name] = param_value_str
-        elif param_value_str.startswith('{') and param_value_str.endswith('}'):
-            # Simple map parsing - for now just store as string
-            params[param_name] = param_value_str
-        else:
-            try:
-                params[param_name] = int(param_value_str)
-            except ValueError:
-                try:
-                    params[param_name] = float(param_value_str)
-                except ValueError:
-                    params[param_name] = param_value_str
+        # Lists and maps are kept as strings for now — full parsing would
+        # need a real Cypher literal parser for nested cases.
+        params[param_name] = common.parse_cypher_literal(row_values[1].strip())
 
     context.query_parameters = params
 
@@ -133,11 +126,8 @@ def step_given_procedure_exists(context: Context, procedure_signature: str) -> N
         Given there exists a procedure test.doNothing() :: ():
         Given there exists a procedure test.my.proc(name :: STRING?, id :: INTEGER?) :: (city :: STRING?, country_code :: INTEGER?):
     """
-    import re
-    from raphtory.gql import register_procedure
-
     # Parse signature: name(input_params) :: (output_params)
-    m = re.match(r'([\w.]+)\((.*?)\)\s*::\s*\((.*?)\)', procedure_signature, re.DOTALL)
+    m = _PROC_SIG_RE.match(procedure_signature)
     if not m:
         proc_name = procedure_signature.split('(')[0].strip()
         input_params = []
@@ -155,31 +145,20 @@ def step_given_procedure_exists(context: Context, procedure_signature: str) -> N
         input_params = parse_params(input_part)
         output_params = parse_params(output_part)
 
-    # Parse data table rows, converting Cypher literals to Python values
+    # Parse data table rows, converting Cypher literals to Python values.
+    # Bind the table once and zip headings against row.cells — indexing a
+    # behave Row by heading does a linear scan of the headings per cell.
     data_rows = []
-    if hasattr(context, "table") and context.table:
-        headings = list(context.table.headings)
-        for row in context.table:
-            row_dict = {}
-            for h in headings:
-                raw = row[h].strip()
-                if raw == 'null':
-                    row_dict[h] = None
-                elif raw == 'true':
-                    row_dict[h] = True
-                elif raw == 'false':
-                    row_dict[h] = False
-                elif (raw.startswith("'") and raw.endswith("'")) or (raw.startswith('"') and raw.endswith('"')):
-                    row_dict[h] = raw[1:-1]
-                else:
-                    try:
-                        row_dict[h] = int(raw)
-                    except ValueError:
-                        try:
-                            row_dict[h] = float(raw)
-                        except ValueError:
-                            row_dict[h] = raw
-            data_rows.append(row_dict)
+    table = getattr(context, "table", None)
+    if table:
+        headings = list(table.headings)
+        data_rows = [
+            {
+                h: common.parse_cypher_literal(cell.strip())
+                for h, cell in zip(headings, row.cells)
+            }
+            for row in table
+        ]
 
     # Register with the Rust coordinator
     register_procedure(context.graph_db, proc_name, input_params, output_params, data_rows)
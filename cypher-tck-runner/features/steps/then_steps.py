@@ -12,15 +12,28 @@ if TYPE_CHECKING:
     from behave.runner import Context
 
 
-@then("the result should be, in any order:")
-def step_then_result_unordered(context: Context) -> None:
-    """Assert that query results match expected results (order doesn't matter).
+def _parse_expected_table(context: Context) -> tuple[list[str], list[list], frozenset[str]]:
+    """Parse the step's expected-result table, caching on the table object.
 
-    Expected format:
-        Then the result should be, in any order:
-          | column1 | column2 |
-          | value1  | value2  |
+    Scenario outlines re-run the same Then step against the same table, so
+    the parsed (columns, rows, column-set) triple is stashed on the behave
+    table itself and reused instead of re-walking every cell.
     """
+    parsed = getattr(context.table, "_parsed", None)
+    if parsed is None:
+        # Behave separates headings from rows, but parse_table_rows expects
+        # headers as the first row.
+        table_rows = [list(context.table.headings)] + [
+            [cell for cell in row] for row in context.table
+        ]
+        columns, rows = ResultMatcher.parse_table_rows(table_rows)
+        parsed = (columns, rows, frozenset(columns))
+        context.table._parsed = parsed
+    return parsed
+
+
+def _require_query_result(context: Context) -> None:
+    """Fail fast if the query errored or produced no result."""
     if context.actual_error:
         raise AssertionError(
             f"Query failed with error: {context.actual_error}\n"
@@ -30,18 +43,20 @@ def step_then_result_unordered(context: Context) -> None:
     if not context.query_result:
         raise AssertionError("No query result available")
 
-    # Parse expected results from the table
-    # Behave separates headings from rows, but parse_table_rows expects headers as first row
-    table_rows = [list(context.table.headings)] + [[cell for cell in row] for row in context.table]
-    expected_columns, expected_rows = ResultMatcher.parse_table_rows(table_rows)
 
-    # Compare results (unordered)
+def _assert_result_matches(context: Context, ordered: bool) -> None:
+    """Shared body of the ordered/unordered result assertion steps."""
+    _require_query_result(context)
+
+    expected_columns, expected_rows, expected_columns_set = _parse_expected_table(context)
+
     match, error = ResultMatcher.compare_results(
         actual_columns=context.query_result.columns,
         actual_rows=context.query_result.rows,
         expected_columns=expected_columns,
         expected_rows=expected_rows,
-        ordered=False,
+        ordered=ordered,
+        expected_columns_set=expected_columns_set,
     )
 
     if not match:
@@ -50,6 +65,18 @@ def step_then_result_unordered(context: Context) -> None:
         )
 
 
+@then("the result should be, in any order:")
+def step_then_result_unordered(context: Context) -> None:
+    """Assert that query results match expected results (order doesn't matter).
+
+    Expected format:
+        Then the result should be, in any order:
+          | column1 | column2 |
+          | value1  | value2  |
+    """
+    _assert_result_matches(context, ordered=False)
+
+
 @then("the result should be, in order:")
 def step_then_result_ordered(context: Context) -> None:
     """Assert that query results match expected results (order matters).
@@ -59,33 +86,7 @@ def step_then_result_ordered(context: Context) -> None:
           | column1 | column2 |
           | value1  | value2  |
     """
-    if context.actual_error:
-        raise AssertionError(
-            f"Query failed with error: {context.actual_error}\n"
-            f"Query was: {context.last_query}"
-        )
-
-    if not context.query_result:
-        raise AssertionError("No query result available")
-
-    # Parse expected results from the table
-    # Behave separates headings from rows, but parse_table_rows expects headers as first row
-    table_rows = [list(context.table.headings)] + [[cell for cell in row] for row in context.table]
-    expected_columns, expected_rows = ResultMatcher.parse_table_rows(table_rows)
-
-    # Compare results (ordered)
-    match, error = ResultMatcher.compare_results(
-        actual_columns=context.query_result.columns,
-        actual_rows=context.query_result.rows,
-        expected_columns=expected_columns,
-        expected_rows=expected_rows,
-        ordered=True,
-    )
-
-    if not match:
-        raise AssertionError(
-            f"Result mismatch:\n{error}\n" f"Query was: {context.last_query}"
-        )
+    _assert_result_matches(context, ordered=True)
 
 
 @then("the result should be empty")
@@ -95,14 +96,7 @@ def step_then_result_empty(context: Context) -> None:
     Expected format:
         Then the result should be empty
     """
-    if context.actual_error:
-        raise AssertionError(
-            f"Query failed with error: {context.actual_error}\n"
-            f"Query was: {context.last_query}"
-        )
-
-    if not context.query_result:
-        raise AssertionError("No query result available")
+    _require_query_result(context)
 
     if not context.query_result.is_empty():
         raise AssertionError(
@@ -146,19 +140,14 @@ def step_then_side_effects(context: Context) -> None:
     # Parse expected side effects from the table
     # Behave always treats first row as headings, so side-effect key-value pairs
     # are split: first pair in headings, remaining pairs in rows.
-    expected_effects = {}
-    
-    # Always parse the headings as the first key-value pair
-    if len(context.table.headings) >= 2:
-        effect_name = context.table.headings[0]
-        effect_value = int(context.table.headings[1])
-        expected_effects[effect_name] = effect_value
-    
-    # Parse remaining key-value pairs from rows
-    for row in context.table:
-        effect_name = row[0]
-        effect_value = int(row[1])
-        expected_effects[effect_name] = effect_value
+    headings = context.table.headings
+    try:
+        expected_effects = dict(zip(headings[::2], map(int, headings[1::2])))
+        expected_effects.update((row[0], int(row[1])) for row in context.table)
+    except ValueError as e:
+        raise AssertionError(
+            f"Malformed side effects table: {e}\n" f"Query was: {context.last_query}"
+        ) from e
 
     # Get actual side effects
     actual_effects = context.side_effects.to_dict()
@@ -8,10 +8,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class SideEffects:
     """Track side effects from graph operations."""
 
@@ -23,42 +23,41 @@ class SideEffects:
     labels_added: int = 0
     labels_removed: int = 0
 
+    # (attribute, TCK key) pairs driving to_dict, in TCK reporting order.
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("nodes_created", "+nodes"),
+        ("nodes_deleted", "-nodes"),
+        ("relationships_created", "+relationships"),
+        ("relationships_deleted", "-relationships"),
+        ("properties_set", "+properties"),
+        ("labels_added", "+labels"),
+        ("labels_removed", "-labels"),
+    )
+
     def to_dict(self) -> dict[str, int]:
         """Convert to dictionary format matching TCK expectations."""
-        result = {}
-        if self.nodes_created > 0:
-            result["+nodes"] = self.nodes_created
-        if self.nodes_deleted > 0:
-            result["-nodes"] = self.nodes_deleted
-        if self.relationships_created > 0:
-            result["+relationships"] = self.relationships_created
-        if self.relationships_deleted > 0:
-            result["-relationships"] = self.relationships_deleted
-        if self.properties_set > 0:
-            result["+properties"] = self.properties_set
-        if self.labels_added > 0:
-            result["+labels"] = self.labels_added
-        if self.labels_removed > 0:
-            result["-labels"] = self.labels_removed
-        return result
+        return {
+            key: value
+            for attr, key in self._FIELDS
+            if (value := getattr(self, attr)) > 0
+        }
 
     def has_no_effects(self) -> bool:
         """Check if there are no side effects."""
-        return all(
-            value == 0
-            for value in [
-                self.nodes_created,
-                self.nodes_deleted,
-                self.relationships_created,
-                self.relationships_deleted,
-                self.properties_set,
-                self.labels_added,
-                self.labels_removed,
-            ]
-        )
-
-
-@dataclass
+        # Counts are non-negative, so the OR is zero exactly when all are;
+        # no tuple/list construction or dunder-eq dispatch per call.
+        return (
+            self.nodes_created
+            | self.nodes_deleted
+            | self.relationships_created
+            | self.relationships_deleted
+            | self.properties_set
+            | self.labels_added
+            | self.labels_removed
+        ) == 0
+
+
+@dataclass(slots=True)
 class Node:
     """Represents a graph node."""
 
@@ -67,7 +66,7 @@ class Node:
     properties: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """Represents a graph relationship."""
 
@@ -109,7 +108,7 @@ class GraphDatabase(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result of a Cypher query execution."""
 
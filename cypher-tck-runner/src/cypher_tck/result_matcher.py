@@ -7,10 +7,21 @@ unordered comparisons using Polars DataFrames.
 
 from __future__ import annotations
 
+import ast
+import functools
+import math
+import re
+import sys
 from typing import Any
 
 import polars as pl
 
+# Keyword literals (matched case-insensitively, as before) and a numeric
+# pattern validated up front — int()/float() probing raises and catches a
+# ValueError for every node/relationship/string cell, which is most cells.
+_KEYWORD_LITERALS = {"null": None, "true": True, "false": False}
+_NUMBER_RE = re.compile(r"[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
 
 class ResultMatcher:
     """Matches query results against expected results."""
@@ -28,14 +39,21 @@ class ResultMatcher:
         if not table_rows:
             return [], []
 
-        headers = table_rows[0]
-        rows = []
-
-        for row in table_rows[1:]:
-            row_dict = {}
-            for header, value in zip(headers, row):
-                row_dict[header] = ResultMatcher._parse_value(value)
-            rows.append(row_dict)
+        # Interned headers mean every row dict (and the DataFrame built
+        # from them) shares one key object per column, so key hashing and
+        # comparison hit the pointer-equality fast path.
+        headers = [sys.intern(h) for h in table_rows[0]]
+        data = table_rows[1:]
+        if not data:
+            return headers, []
+
+        # Parse column-major: zip(*data) runs the transpose at C level and
+        # keeps each column's values (usually homogeneous) together, which
+        # is friendlier to _parse_value's branch prediction than walking
+        # cell-by-cell across mixed-type rows.
+        parse = ResultMatcher._parse_value
+        columns = [[parse(cell) for cell in col] for col in zip(*data)]
+        rows = [dict(zip(headers, values)) for values in zip(*columns)]
 
         return headers, rows
 
@@ -61,27 +79,20 @@ class ResultMatcher:
         """
         value = value.strip()
 
-        # Handle null
-        if value.lower() == "null":
-            return None
+        # Handle null/true/false (case-insensitive)
+        lowered = value.lower()
+        if lowered in _KEYWORD_LITERALS:
+            return _KEYWORD_LITERALS[lowered]
 
         # Handle NaN
         if value == "NaN":
             return float("nan")
 
-        # Handle booleans
-        if value.lower() == "true":
-            return True
-        if value.lower() == "false":
-            return False
-
         # Handle numbers (including scientific notation)
-        try:
-            if "." in value or "e" in value.lower():
+        if _NUMBER_RE.fullmatch(value):
+            if "." in value or "e" in lowered:
                 return float(value)
             return int(value)
-        except ValueError:
-            pass
 
         # Handle strings (quoted)
         if (value.startswith("'") and value.endswith("'")) or (
@@ -102,6 +113,18 @@ class ResultMatcher:
 
         Handles nested lists, quoted strings, and mixed types.
         """
+        # Fast path: most list cells are plain Python literals ([1, 2],
+        # ['a', 'b']) that ast.literal_eval parses in C-backed code. Cells
+        # with Cypher-only tokens (null, true, dates, node reprs) raise and
+        # fall through to the character scanner.
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+        else:
+            if isinstance(parsed, list):
+                return parsed
+
         inner = value[1:-1].strip()
         if not inner:
             return []
@@ -147,8 +170,6 @@ class ResultMatcher:
         Handles patterns like '(:Label {b: 2, a: 1})' -> '(:Label {a: 1, b: 2})'
         so that property key order doesn't affect comparison.
         """
-        import re
-
         # Match node pattern: optional labels, optional properties
         # e.g., '(:B {num: 5, bool: false})' or '(:A:B {x: 1})'
         m = re.match(r'^(\((?::\w+(?::[\w]+)*)?)\s*\{(.*)\}\)$', s, re.DOTALL)
@@ -212,34 +233,28 @@ class ResultMatcher:
         """
         if val is None:
             return None
-        if isinstance(val, float):
-            if val != val:  # NaN
-                return "NaN"
-            if val == int(val) and not (val == 0.0 and str(val).startswith("-")):
-                return int(val)
-            return val
         if isinstance(val, list):
             return [ResultMatcher._normalize_value(v) for v in val]
-        if isinstance(val, str):
-            # Parse string-encoded lists from the engine (e.g., '["1984-10-12"]')
-            if val.startswith("[") and val.endswith("]"):
-                try:
-                    parsed = ResultMatcher._parse_list(val)
-                    return [ResultMatcher._normalize_value(v) for v in parsed]
-                except Exception:
-                    pass
-            # Normalize node strings so property order doesn't affect comparison
-            if val.startswith("(:") and val.endswith(")") and "{" in val:
-                return ResultMatcher._normalize_node_string(val)
-        return val
+        try:
+            return _normalize_scalar(val)
+        except TypeError:  # unhashable value from the engine, e.g. a dict
+            return val
 
     @staticmethod
-    def _normalize_row(row: dict[str, Any]) -> dict[str, str]:
-        """Normalize a row by converting all values to canonical string form."""
+    def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+        """Normalize a row, keeping native types where Polars can compare them.
+
+        Ints, floats, bools, strings and lists stay typed so the DataFrame
+        comparison runs vectorized per-column kernels; only values Polars
+        has no dtype for (e.g. raw engine objects) are stringified.
+        """
         result = {}
         for k, v in row.items():
             v = ResultMatcher._normalize_value(v)
-            result[k] = str(v) if v is not None else None
+            if v is None or isinstance(v, (bool, int, float, str, list)):
+                result[k] = v
+            else:
+                result[k] = str(v)
         return result
 
     @staticmethod
@@ -249,6 +264,7 @@ class ResultMatcher:
         expected_columns: list[str],
         expected_rows: list[dict[str, Any]],
         ordered: bool = False,
+        expected_columns_set: frozenset[str] | None = None,
     ) -> tuple[bool, str]:
         """Compare actual query results with expected results.
 
@@ -258,12 +274,17 @@ class ResultMatcher:
             expected_columns: Expected column names
             expected_rows: Expected rows
             ordered: Whether to preserve row order in comparison
+            expected_columns_set: Optional precomputed set of the expected
+                column names, for callers that compare against the same
+                table repeatedly
 
         Returns:
             Tuple of (match: bool, error_message: str)
         """
         # Check column names match
-        if set(actual_columns) != set(expected_columns):
+        if expected_columns_set is None:
+            expected_columns_set = frozenset(expected_columns)
+        if set(actual_columns) != expected_columns_set:
             return False, f"Column mismatch: expected {expected_columns}, got {actual_columns}"
 
         # Convert to Polars DataFrames for comparison
@@ -277,22 +298,107 @@ class ResultMatcher:
             if not expected_rows:
                 return False, f"Expected 0 rows, got {len(actual_rows)}"
 
+            # Differing row counts can never match — bail out before paying
+            # for per-cell normalization and DataFrame construction.
+            if len(actual_rows) != len(expected_rows):
+                return False, (
+                    f"Expected {len(expected_rows)} rows, got {len(actual_rows)}"
+                )
+
             # Normalize values for comparison (type coercion)
             norm_actual = [ResultMatcher._normalize_row(r) for r in actual_rows]
-            norm_expected = [ResultMatcher._normalize_row(r) for r in expected_rows]
 
-            actual_df = pl.DataFrame(norm_actual)
-            expected_df = pl.DataFrame(norm_expected)
+            norm_expected = None
+            try:
+                # strict=False lets a mixed column (e.g. int and string
+                # cells) coerce to a common supertype instead of raising.
+                actual_df = pl.DataFrame(norm_actual, strict=False)
 
-            # Cast all columns to String to ensure type-consistent comparison
-            # (avoids Polars Null vs String type mismatches for null-only columns)
-            actual_df = actual_df.cast({col: pl.String for col in actual_df.columns})
-            expected_df = expected_df.cast({col: pl.String for col in expected_df.columns})
+                # Scenario outlines replay the same expected table many
+                # times; build its normalized form and DataFrame once per
+                # distinct table. Unhashable cells (dicts) skip the cache.
+                cols_key = tuple(expected_columns)
+                try:
+                    rows_key = tuple(
+                        tuple(_freeze(r[c]) for c in expected_columns)
+                        for r in expected_rows
+                    )
+                    expected_df, norm_expected = _build_expected_df(cols_key, rows_key)
+                except TypeError:
+                    norm_expected = [
+                        ResultMatcher._normalize_row(r) for r in expected_rows
+                    ]
+                    expected_df = pl.DataFrame(norm_expected, strict=False)
+
+                # Columns whose dtypes agree are compared natively; only
+                # where inference disagreed between the two sides
+                # (null-only columns, typed actual vs string expected)
+                # fall back to string form.
+                for col in expected_columns:
+                    if actual_df.schema[col] == expected_df.schema[col]:
+                        continue
+                    actual_df = actual_df.with_columns(
+                        pl.Series(col, [_stringify(r[col]) for r in norm_actual])
+                    )
+                    expected_df = expected_df.with_columns(
+                        pl.Series(col, [_stringify(r[col]) for r in norm_expected])
+                    )
+            except Exception:
+                # Some columns have no common dtype even with strict=False
+                # (e.g. a list mixing scalars and sublists). Compare those
+                # tables in canonical string form as before.
+                if norm_expected is None:
+                    norm_expected = [
+                        ResultMatcher._normalize_row(r) for r in expected_rows
+                    ]
+                actual_df = pl.DataFrame(
+                    [{k: _stringify(v) for k, v in r.items()} for r in norm_actual]
+                )
+                expected_df = pl.DataFrame(
+                    [{k: _stringify(v) for k, v in r.items()} for r in norm_expected]
+                )
 
             # Reorder columns to match expected order
             actual_df = actual_df.select(expected_columns)
 
             if not ordered:
+                # Order-independent prefilter: equal row multisets have
+                # equal row-hash sums, so differing sums prove a mismatch
+                # without sorting either frame. Equal sums (or any hashing
+                # hiccup on exotic dtypes) fall through to the full
+                # sort-and-compare, so this can never flip a verdict.
+                try:
+                    if actual_df.hash_rows().sum() != expected_df.hash_rows().sum():
+                        return False, (
+                            f"Results don't match:\n"
+                            f"Expected:\n{expected_df}\n"
+                            f"Actual:\n{actual_df}"
+                        )
+                except Exception:
+                    pass
+
+                # Hash-based multiset equality: group identical rows with
+                # their counts and join the two count tables, O(n) instead
+                # of the O(n log n) double sort. Any failure (list-dtype
+                # group keys, a result column named "len") falls back to
+                # the sort-and-compare below, which also produces the
+                # sorted frames used in the mismatch message.
+                try:
+                    key = list(expected_columns)
+                    counts_actual = actual_df.group_by(key).len()
+                    counts_expected = expected_df.group_by(key).len()
+                    if counts_actual.height == counts_expected.height:
+                        overlap = counts_actual.join(
+                            counts_expected,
+                            on=key + ["len"],
+                            how="inner",
+                            nulls_equal=True,
+                        ).height
+                        if overlap == counts_actual.height:
+                            return True, ""
+                except Exception:
+                    pass
+
                 # For unordered comparison, sort both dataframes consistently
                 # Sort by all columns to ensure deterministic comparison
                 actual_df = actual_df.sort(expected_columns)
@@ -326,8 +432,6 @@ class ResultMatcher:
         """
         if actual == expected:
             return True, ""
-        else:
-            return False, f'Side effects mismatch: expected {expected}, got {actual}'
 
         missing = set(expected.keys()) - set(actual.keys())
         extra = set(actual.keys()) - set(expected.keys())
@@ -347,3 +451,84 @@ class ResultMatcher:
                 errors.append(f"{key}: expected {expected[key]}, got {actual[key]}")
 
         return False, "; ".join(errors)
+
+
+def _stringify(val: Any) -> str | None:
+    """Canonical string form used when a column can't be compared typed."""
+    return str(val) if val is not None else None
+
+
+def _freeze(val: Any) -> tuple:
+    """Convert a cell into a hashable, type-aware cache key.
+
+    Every value is tagged with its type name: Python hashes True == 1 and
+    0.0 == 0 as equal, so untagged keys would hand one type's cached frame
+    to a table that differs only in cell type. Zero floats additionally
+    carry their sign, since -0.0 and 0.0 are equal and hash alike too.
+    """
+    if isinstance(val, list):
+        return ("list", tuple(_freeze(v) for v in val))
+    if isinstance(val, float):
+        return ("float", val, math.copysign(1.0, val))
+    return (type(val).__name__, val)
+
+
+def _thaw(val: tuple) -> Any:
+    """Inverse of _freeze: strip the type tag and restore lists."""
+    if val[0] == "list":
+        return [_thaw(v) for v in val[1]]
+    return val[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _build_expected_df(cols: tuple[str, ...], frozen_rows: tuple) -> tuple:
+    """Normalize an expected table and build its DataFrame, memoized.
+
+    Returns (expected_df, norm_expected). Callers treat both as read-only:
+    sort()/with_columns() return new frames, so the cached frame survives.
+    """
+    rows = [{c: _thaw(v) for c, v in zip(cols, row)} for row in frozen_rows]
+    norm_expected = [ResultMatcher._normalize_row(r) for r in rows]
+    return pl.DataFrame(norm_expected, strict=False), norm_expected
+
+
+def _normalize_scalar(val: Any) -> Any:
+    """Normalize a hashable scalar via the memoized implementation.
+
+    Zero-valued floats bypass the cache: -0.0 and 0.0 are equal with the
+    same hash (typed=True can't tell them apart either), so whichever
+    sign was seen first would decide the cached result for both. The
+    normalization is trivial for them anyway — 0.0 becomes 0, -0.0 stays.
+    """
+    if isinstance(val, float) and val == 0.0:
+        return val if math.copysign(1.0, val) < 0 else 0
+    return _normalize_scalar_cached(val)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _normalize_scalar_cached(val: Any) -> Any:
+    """Normalize a hashable scalar, memoized across rows and scenarios.
+
+    Node strings and string-encoded lists repeat heavily within a result
+    set, and the string normalizers re-scan character by character.
+    ``typed=True`` keeps bool/int and int/float keys apart — lru_cache
+    would otherwise conflate True with 1.
+    """
+    if isinstance(val, float):
+        if val != val:  # NaN
+            return "NaN"
+        if val == int(val) and not (val == 0.0 and str(val).startswith("-")):
+            return int(val)
+        return val
+    if isinstance(val, str):
+        # Parse string-encoded lists from the engine (e.g., '["1984-10-12"]')
+        if val.startswith("[") and val.endswith("]"):
+            try:
+                parsed = ResultMatcher._parse_list(val)
+                return [ResultMatcher._normalize_value(v) for v in parsed]
+            except Exception:
+                pass
+        # Normalize node strings so property order doesn't affect comparison
+        if val.startswith("(:") and val.endswith(")") and "{" in val:
+            return ResultMatcher._normalize_node_string(val)
+    return val
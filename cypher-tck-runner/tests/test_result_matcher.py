@@ -108,6 +108,35 @@ def test_compare_results_column_mismatch() -> None:
     assert "Column mismatch" in error
 
 
+def test_compare_results_cache_distinguishes_bool_from_int() -> None:
+    """Expected tables differing only in cell type must not share a cache entry.
+
+    Python hashes True == 1, so a type-blind cache key would hand the
+    Int64 frame built for | 1 | to a later scenario expecting | true |.
+    """
+    match, error = ResultMatcher.compare_results(["a"], [{"a": 1}], ["a"], [{"a": 1}])
+    assert match is True
+    assert error == ""
+
+    match, error = ResultMatcher.compare_results(
+        ["a"], [{"a": True}], ["a"], [{"a": True}]
+    )
+    assert match is True
+    assert error == ""
+
+
+def test_normalize_value_keeps_negative_zero_distinct() -> None:
+    """-0.0 and 0.0 hash equal, so caching must not merge their results."""
+    assert ResultMatcher._normalize_value(0.0) == 0
+    neg = ResultMatcher._normalize_value(-0.0)
+    assert isinstance(neg, float) and str(neg) == "-0.0"
+
+    match, _ = ResultMatcher.compare_results(
+        ["a"], [{"a": -0.0}], ["a"], [{"a": 0.0}], ordered=True
+    )
+    assert match is False
+
+
 def test_compare_side_effects_match() -> None:
     """Test comparing matching side effects."""
     actual = {"+nodes": 2, "+labels": 1}